@@ -221,7 +221,7 @@ def synthetic_datalist(request) -> DataList:
 # =============================================================================
 # Input data
 # =============================================================================
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_data_array():
     rng = np.random.default_rng(7)
     noise = rng.normal(5, 3, size=(25, 5, 4))
@@ -239,14 +239,14 @@ def mock_data_array():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_dataset(mock_data_array):
     t2m = mock_data_array
     prcp = t2m**2
     return xr.Dataset({"t2m": t2m, "prcp": prcp})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_data_array_list(mock_data_array):
     da1 = mock_data_array
     da2 = mock_data_array**2
@@ -277,12 +277,12 @@ def mock_data_array_boundary_nans(mock_data_array):
     return valid_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_dask_data_array(mock_data_array):
     return mock_data_array.chunk({"lon": 2, "lat": 2, "time": -1})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_complex_data_array():
     def f1(x, t):
         return xr.DataArray(
@@ -8,6 +8,26 @@ warnings.filterwarnings("ignore", message="numpy.dtype size changed")
 warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
 
 
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def fit_dim(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def ceof_model(fit_dim, mock_data_array):
+    """ComplexEOF model fitted once per dimension parametrization."""
+    ceof = ComplexEOF(n_modes=2)
+    ceof.fit(mock_data_array, fit_dim)
+    return ceof
+
+
 @pytest.mark.parametrize(
     "dim",
     [
@@ -27,78 +47,34 @@ def test_fit(mock_data_array, dim):
     assert hasattr(ceof, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components_amplitude(mock_data_array, dim):
+def test_components_amplitude(ceof_model):
     """Test computation of components amplitude in ComplexEOF model"""
-    ceof = ComplexEOF(n_modes=2)
-    ceof.fit(mock_data_array, dim)
-
-    comp_amp = ceof.components_amplitude()
+    comp_amp = ceof_model.components_amplitude()
     assert comp_amp is not None
     assert (comp_amp.fillna(0) >= 0).all()  # type: ignore
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components_phase(mock_data_array, dim):
+def test_components_phase(ceof_model):
     """Test computation of components phase in ComplexEOF model"""
-    ceof = ComplexEOF(n_modes=2)
-    ceof.fit(mock_data_array, dim)
-
-    comp_phase = ceof.components_phase()
+    comp_phase = ceof_model.components_phase()
     assert comp_phase is not None
-    assert ((-np.pi <= comp_phase.fillna(0)) & (comp_phase.fillna(0) <= np.pi)).all()  # type: ignore
+    phase = comp_phase.fillna(0).values
+    assert np.abs(phase).max() <= np.pi
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores_amplitude(mock_data_array, dim):
+def test_scores_amplitude(ceof_model):
     """Test computation of scores amplitude in ComplexEOF model"""
-    ceof = ComplexEOF(n_modes=2)
-    ceof.fit(mock_data_array, dim)
-
-    scores_amp = ceof.scores_amplitude()
+    scores_amp = ceof_model.scores_amplitude()
     assert scores_amp is not None
     assert (scores_amp.fillna(0) >= 0).all()  # type: ignore
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores_phase(mock_data_array, dim):
+def test_scores_phase(ceof_model):
     """Test computation of scores phase in ComplexEOF model"""
-    ceof = ComplexEOF(n_modes=2)
-    ceof.fit(mock_data_array, dim)
-
-    scores_phase = ceof.scores_phase()
+    scores_phase = ceof_model.scores_phase()
     assert scores_phase is not None
-    assert (
-        (-np.pi <= scores_phase.fillna(0)) & (scores_phase.fillna(0) <= np.pi)
-    ).all()  # type: ignore
+    phase = scores_phase.fillna(0).values
+    assert np.abs(phase).max() <= np.pi
 
 
 @pytest.mark.parametrize(
@@ -9,6 +9,26 @@ def mca_model():
     return ComplexMCA(n_modes=3)
 
 
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def fit_dim(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def mca_model_fitted(fit_dim, mock_data_array):
+    """ComplexMCA model fitted once per dimension parametrization."""
+    mca = ComplexMCA(n_modes=3)
+    mca.fit(mock_data_array, mock_data_array, fit_dim)
+    return mca
+
+
 def test_initialization():
     mca = ComplexMCA(n_modes=1)
     assert mca is not None
@@ -29,164 +49,74 @@ def test_fit(mca_model, mock_data_array, dim):
     assert hasattr(mca_model, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    squared_covariance = mca_model.squared_covariance()
+def test_squared_covariance(mca_model_fitted):
+    squared_covariance = mca_model_fitted.squared_covariance()
     assert isinstance(squared_covariance, xr.DataArray)
     assert (squared_covariance > 0).all()
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    squared_covariance_fraction = mca_model.squared_covariance_fraction()
+def test_squared_covariance_fraction(mca_model_fitted):
+    squared_covariance_fraction = mca_model_fitted.squared_covariance_fraction()
     assert isinstance(squared_covariance_fraction, xr.DataArray)
     assert (squared_covariance_fraction > 0).all()
     assert squared_covariance_fraction.sum("mode") <= 1
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_singular_values(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    n_modes = mca_model.get_params()["n_modes"]
-    svals = mca_model.singular_values()
+def test_singular_values(mca_model_fitted):
+    n_modes = mca_model_fitted.get_params()["n_modes"]
+    svals = mca_model_fitted.singular_values()
     assert isinstance(svals, xr.DataArray)
     assert svals.size == n_modes
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    cf = mca_model.covariance_fraction()
+def test_covariance_fraction(mca_model_fitted):
+    cf = mca_model_fitted.covariance_fraction()
     assert isinstance(cf, xr.DataArray)
     assert cf.sum("mode") <= 1.00001, "Covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    components = mca_model.components()
+def test_components(mca_model_fitted):
+    components = mca_model_fitted.components()
     assert isinstance(components, tuple), "components is not a tuple"
     assert len(components) == 2, "components list does not have 2 elements"
     assert isinstance(components[0], xr.DataArray), "components[0] is not a DataArray"
     assert isinstance(components[1], xr.DataArray), "components[1] is not a DataArray"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scores = mca_model.scores()
+def test_scores(mca_model_fitted):
+    scores = mca_model_fitted.scores()
     assert isinstance(scores, tuple), "scores is not a tuple"
     assert len(scores) == 2, "scores list does not have 2 elements"
     assert isinstance(scores[0], xr.DataArray), "scores[0] is not a DataArray"
     assert isinstance(scores[1], xr.DataArray), "scores[1] is not a DataArray"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components_amplitude(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    components = mca_model.components_amplitude()
+def test_components_amplitude(mca_model_fitted):
+    components = mca_model_fitted.components_amplitude()
     assert isinstance(components, tuple), "components is not a tuple"
     assert len(components) == 2, "components list does not have 2 elements"
     assert isinstance(components[0], xr.DataArray), "components[0] is not a DataArray"
     assert isinstance(components[1], xr.DataArray), "components[1] is not a DataArray"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components_phase(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    components = mca_model.components_phase()
+def test_components_phase(mca_model_fitted):
+    components = mca_model_fitted.components_phase()
     assert isinstance(components, tuple), "components is not a tuple"
     assert len(components) == 2, "components list does not have 2 elements"
     assert isinstance(components[0], xr.DataArray), "components[0] is not a DataArray"
     assert isinstance(components[1], xr.DataArray), "components[1] is not a DataArray"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores_amplitude(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scores = mca_model.scores_amplitude()
+def test_scores_amplitude(mca_model_fitted):
+    scores = mca_model_fitted.scores_amplitude()
     assert isinstance(scores, tuple), "scores is not a tuple"
     assert len(scores) == 2, "scores list does not have 2 elements"
     assert isinstance(scores[0], xr.DataArray), "scores[0] is not a DataArray"
     assert isinstance(scores[1], xr.DataArray), "scores[1] is not a DataArray"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores_phase(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scores = mca_model.scores_phase()
+def test_scores_phase(mca_model_fitted):
+    scores = mca_model_fitted.scores_phase()
     assert isinstance(scores, tuple), "scores is not a tuple"
     assert len(scores) == 2, "scores list does not have 2 elements"
     assert isinstance(scores[0], xr.DataArray), "scores[0] is not a DataArray"
@@ -65,6 +65,35 @@ def test_fit_full_matrices(mock_data_array):
     assert decomposer.V_.shape[1] == 2
 
 
+def test_fit_values_only(mock_data_array):
+    decomposer = Decomposer(n_modes=2, solver="full", compute_uv=False)
+    decomposer.fit(mock_data_array)
+    assert "s_" in decomposer.__dict__
+    assert "U_" not in decomposer.__dict__
+    assert "V_" not in decomposer.__dict__
+
+    # Check that indeed 2 modes are returned
+    assert decomposer.s_.shape[0] == 2
+
+    # Singular values must match those of the full decomposition
+    decomposer_full = Decomposer(n_modes=2, solver="full")
+    decomposer_full.fit(mock_data_array)
+    np.testing.assert_allclose(decomposer.s_, decomposer_full.s_)
+
+
+def test_fit_values_only_randomized(mock_data_array):
+    decomposer = Decomposer(
+        n_modes=2, solver="randomized", compute_uv=False, random_state=42
+    )
+    decomposer.fit(mock_data_array)
+    assert "s_" in decomposer.__dict__
+    assert "U_" not in decomposer.__dict__
+    assert "V_" not in decomposer.__dict__
+
+    # Check that indeed 2 modes are returned
+    assert decomposer.s_.shape[0] == 2
+
+
 def test_fit_randomized(mock_data_array):
     decomposer = Decomposer(n_modes=2, solver="randomized", random_state=42)
     decomposer.fit(mock_data_array)
@@ -78,6 +107,39 @@ def test_fit_randomized(mock_data_array):
     assert decomposer.V_.shape[1] == 2
 
 
+def test_fit_arpack(mock_data_array):
+    decomposer = Decomposer(n_modes=2, solver="arpack", random_state=42)
+    decomposer.fit(mock_data_array)
+    assert "U_" in decomposer.__dict__
+    assert "s_" in decomposer.__dict__
+    assert "V_" in decomposer.__dict__
+
+    # Check that indeed 2 modes are returned
+    assert decomposer.U_.shape[1] == 2
+    assert decomposer.s_.shape[0] == 2
+    assert decomposer.V_.shape[1] == 2
+
+    # Singular values must match those of the full decomposition
+    decomposer_full = Decomposer(n_modes=2, solver="full")
+    decomposer_full.fit(mock_data_array)
+    np.testing.assert_allclose(decomposer.s_, decomposer_full.s_)
+
+
+def test_fit_arpack_complex(mock_complex_data_array):
+    decomposer = Decomposer(n_modes=2, solver="arpack", random_state=42)
+    decomposer.fit(mock_complex_data_array)
+
+    # Check that U and V are complex
+    assert np.iscomplexobj(decomposer.U_.data)
+    assert np.iscomplexobj(decomposer.V_.data)
+
+
+def test_fit_arpack_dask_raises(mock_dask_data_array):
+    decomposer = Decomposer(n_modes=2, solver="arpack", random_state=42)
+    with pytest.raises(ValueError):
+        decomposer.fit(mock_dask_data_array)
+
+
 def test_fit_dask_full(mock_dask_data_array):
     # The Dask SVD solver has no parameter 'random_state' but 'seed' instead,
     # so let's create a new decomposer for this case
@@ -98,6 +160,19 @@ def test_fit_dask_full(mock_dask_data_array):
     assert decomposer.V_.shape[1] == 2
 
 
+def test_fit_dask_full_values_only(mock_dask_data_array):
+    # The Dask SVD solver has no values-only mode, so the singular vectors
+    # are computed and discarded
+    decomposer = Decomposer(n_modes=2, solver="full", compute_uv=False)
+    decomposer.fit(mock_dask_data_array)
+    assert "s_" in decomposer.__dict__
+    assert "U_" not in decomposer.__dict__
+    assert "V_" not in decomposer.__dict__
+
+    # Check that indeed 2 modes are returned
+    assert decomposer.s_.shape[0] == 2
+
+
 @pytest.mark.parametrize("compute", [True, False])
 def test_fit_dask_randomized(mock_dask_data_array, compute):
     # The Dask SVD solver has no parameter 'random_state' but 'seed' instead,
@@ -176,4 +251,4 @@ def test_random_state(
     U2 = decomposer.U_.data
 
     # Check that the results are the same
-    assert np.alltrue(U1 == U2)
+    assert np.all(U1 == U2)
@@ -3,6 +3,31 @@ import xarray as xr
 import pytest
 
 from xeofs.models.eof import EOF
+from ..utilities import data_is_dask
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def fit_dim(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def eof_model(fit_dim, mock_data_array):
+    """EOF model fitted once per dimension parametrization.
+
+    The accessor tests below are read-only, so they can share a single
+    fitted model instead of repeating the SVD for every test.
+    """
+    eof = EOF()
+    eof.fit(mock_data_array, fit_dim)
+    return eof
 
 
 def test_init():
@@ -41,52 +66,58 @@ def test_fit(dim, mock_data_array):
         (("lon", "lat")),
     ],
 )
-def test_singular_values(dim, mock_data_array):
-    """Tests the singular_values method of the EOF class"""
+def test_fit_randomized_solver(dim, mock_data_array):
+    """The randomized solver should reproduce the full SVD solution."""
 
-    eof = EOF()
-    eof.fit(mock_data_array, dim)
+    eof_full = EOF(n_modes=2, solver="full")
+    eof_full.fit(mock_data_array, dim)
+
+    eof_randomized = EOF(n_modes=2, solver="randomized", random_state=7)
+    eof_randomized.fit(mock_data_array, dim)
+
+    np.testing.assert_allclose(
+        eof_full.singular_values(), eof_randomized.singular_values(), rtol=1e-3
+    )
+    np.testing.assert_allclose(
+        eof_full.explained_variance(), eof_randomized.explained_variance(), rtol=1e-3
+    )
+    # Small-magnitude loadings need an absolute tolerance as well
+    np.testing.assert_allclose(
+        eof_full.components(), eof_randomized.components(), rtol=1e-3, atol=1e-3
+    )
 
+
+def test_fit_float32(mock_data_array):
+    """Single-precision input must not be upcast during preprocessing, so the
+    SVD itself runs in single precision."""
+    eof = EOF(n_modes=2, standardize=True, use_coslat=True)
+    eof.fit(mock_data_array.astype("float32"), ("time",))
+
+    assert eof.components().dtype == np.float32
+    assert eof.scores().dtype == np.float32
+    assert eof.singular_values().dtype == np.float32
+
+
+def test_singular_values(eof_model):
+    """Tests the singular_values method of the EOF class"""
     # Test singular_values method
-    singular_values = eof.singular_values()
+    singular_values = eof_model.singular_values()
     assert isinstance(singular_values, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_explained_variance(dim, mock_data_array):
+def test_explained_variance(eof_model):
     """Tests the explained_variance method of the EOF class"""
-    eof = EOF()
-    eof.fit(mock_data_array, dim)
-
     # Test explained_variance method
-    explained_variance = eof.explained_variance()
+    explained_variance = eof_model.explained_variance()
     assert isinstance(explained_variance, xr.DataArray)
     # Explained variance must be positive
     assert (explained_variance > 0).all()
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_explained_variance_ratio(dim, mock_data_array):
+def test_explained_variance_ratio(eof_model):
     """Tests the explained_variance_ratio method of the EOF class"""
-    eof = EOF()
-    eof.fit(mock_data_array, dim)
-
     # Test explained_variance_ratio method
-    explained_variance_ratio = eof.explained_variance_ratio()
+    explained_variance_ratio = eof_model.explained_variance_ratio()
     assert isinstance(explained_variance_ratio, xr.DataArray)
     # Explained variance ratio must be positive
     assert (
@@ -113,22 +144,11 @@ def test_isolated_nans(dim, mock_data_array_isolated_nans):
         eof.fit(mock_data_array_isolated_nans, dim)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components(dim, mock_data_array):
+def test_components(eof_model, fit_dim, mock_data_array):
     """Tests the components method of the EOF class"""
-    eof = EOF()
-    eof.fit(mock_data_array, dim)
-
     # Test components method
-    components = eof.components()
-    feature_dims = tuple(set(mock_data_array.dims) - set(dim))
+    components = eof_model.components()
+    feature_dims = tuple(set(mock_data_array.dims) - set(fit_dim))
     assert isinstance(components, xr.DataArray), "Components is not a DataArray"
     assert set(components.dims) == set(
         ("mode",) + feature_dims
@@ -233,24 +253,13 @@ def test_components_dataarray_list(dim, mock_data_array_list):
         ), "Components does not have the right feature dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores(dim, mock_data_array):
+def test_scores(eof_model, fit_dim):
     """Tests the scores method of the EOF class"""
-    eof = EOF()
-    eof.fit(mock_data_array, dim)
-
     # Test scores method
-    scores = eof.scores()
+    scores = eof_model.scores()
     assert isinstance(scores, xr.DataArray), "Scores is not a DataArray"
     assert set(scores.dims) == set(
-        (dim + ("mode",))
+        (fit_dim + ("mode",))
     ), "Scores does not have the right dimensions"
 
 
@@ -338,6 +347,31 @@ def test_scores_dataarray_list(dim, mock_data_array_list):
     ), "Scores does not have the right dimensions"
 
 
+@pytest.mark.parametrize(
+    "dim",
+    [
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def test_compute(dim, mock_dask_data_array):
+    """Tests that all delayed results are loaded by a single compute call"""
+    eof = EOF(n_modes=2, compute=False, check_nans=False)
+    eof.fit(mock_dask_data_array, dim)
+
+    assert data_is_dask(eof.data["components"])
+    assert data_is_dask(eof.data["scores"])
+
+    eof.compute()
+
+    assert not data_is_dask(eof.data["components"])
+    assert not data_is_dask(eof.data["scores"])
+    assert not data_is_dask(eof.data["norms"])
+    assert not data_is_dask(eof.data["explained_variance"])
+    assert not data_is_dask(eof.data["total_variance"])
+
+
 def test_get_params():
     """Tests the get_params method of the EOF class"""
     eof = EOF(n_modes=5, standardize=True, use_coslat=True)
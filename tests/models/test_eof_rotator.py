@@ -53,6 +53,18 @@ def test_fit(eof_model):
     assert type(eof_rotator.data) == DataContainer
 
 
+def test_fit_float32(mock_data_array):
+    """The rotation must not upcast single-precision models."""
+    eof = EOF(n_modes=5)
+    eof.fit(mock_data_array.astype("float32"), ("time",))
+
+    eof_rotator = EOFRotator(n_modes=4)
+    eof_rotator.fit(eof)
+
+    assert eof_rotator.components().dtype == np.float32
+    assert eof_rotator.scores().dtype == np.float32
+
+
 @pytest.mark.parametrize(
     "dim",
     [
@@ -11,6 +11,26 @@ def mca_model():
     return MCA()
 
 
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def fit_dim(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def mca_model_fitted(fit_dim, mock_data_array):
+    """MCA model fitted once per dimension parametrization."""
+    mca = MCA()
+    mca.fit(mock_data_array, mock_data_array, fit_dim)
+    return mca
+
+
 def test_initialization():
     mca = MCA()
     assert mca is not None
@@ -136,78 +156,33 @@ def test_inverse_transform(mca_model, mock_data_array, dim):
     assert isinstance(Xrec2, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    squared_covariance = mca_model.squared_covariance()
+def test_squared_covariance(mca_model_fitted):
+    squared_covariance = mca_model_fitted.squared_covariance()
     assert isinstance(squared_covariance, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scf = mca_model.squared_covariance_fraction()
+def test_squared_covariance_fraction(mca_model_fitted):
+    scf = mca_model_fitted.squared_covariance_fraction()
     assert isinstance(scf, xr.DataArray)
     assert scf.sum("mode") <= 1.00001, "Squared covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_singular_values(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    n_modes = mca_model.get_params()["n_modes"]
-    svals = mca_model.singular_values()
+def test_singular_values(mca_model_fitted):
+    n_modes = mca_model_fitted.get_params()["n_modes"]
+    svals = mca_model_fitted.singular_values()
     assert isinstance(svals, xr.DataArray)
     assert svals.size == n_modes
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    cf = mca_model.covariance_fraction()
+def test_covariance_fraction(mca_model_fitted):
+    cf = mca_model_fitted.covariance_fraction()
     assert isinstance(cf, xr.DataArray)
     assert cf.sum("mode") <= 1.00001, "Covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    components1, components2 = mca_model.components()
-    feature_dims = tuple(set(mock_data_array.dims) - set(dim))
+def test_components(mca_model_fitted, fit_dim, mock_data_array):
+    components1, components2 = mca_model_fitted.components()
+    feature_dims = tuple(set(mock_data_array.dims) - set(fit_dim))
     assert isinstance(components1, xr.DataArray)
     assert isinstance(components2, xr.DataArray)
     assert set(components1.dims) == set(
@@ -274,24 +249,15 @@ def test_components_dataarray_list(mca_model, mock_data_array_list, dim):
         ), "Components2 does not have the right feature dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scores1, scores2 = mca_model.scores()
+def test_scores(mca_model_fitted, fit_dim):
+    scores1, scores2 = mca_model_fitted.scores()
     assert isinstance(scores1, xr.DataArray)
     assert isinstance(scores2, xr.DataArray)
     assert set(scores1.dims) == set(
-        (dim + ("mode",))
+        (fit_dim + ("mode",))
     ), "Scores1 does not have the right dimensions"
     assert set(scores2.dims) == set(
-        (dim + ("mode",))
+        (fit_dim + ("mode",))
     ), "Scores2 does not have the right dimensions"
 
 
@@ -337,34 +303,16 @@ def test_scores_dataarray_list(mca_model, mock_data_array_list, dim):
     ), "Scores2 does not have the right dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_homogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    patterns, pvals = mca_model.homogeneous_patterns()
+def test_homogeneous_patterns(mca_model_fitted):
+    patterns, pvals = mca_model_fitted.homogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
     assert isinstance(pvals[0], xr.DataArray)
     assert isinstance(pvals[1], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_heterogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    patterns, pvals = mca_model.heterogeneous_patterns()
+def test_heterogeneous_patterns(mca_model_fitted):
+    patterns, pvals = mca_model_fitted.heterogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
     assert isinstance(pvals[0], xr.DataArray)
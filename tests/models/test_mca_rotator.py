@@ -7,13 +7,33 @@ from xeofs.models import MCA, MCARotator
 from ..utilities import data_is_dask
 
 
-@pytest.fixture
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def dim(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
 def mca_model(mock_data_array, dim):
     mca = MCA(n_modes=5)
     mca.fit(mock_data_array, mock_data_array, dim)
     return mca
 
 
+@pytest.fixture(scope="module")
+def mca_rotator(mca_model):
+    """MCARotator fitted once per dimension parametrization."""
+    mca_rotator = MCARotator(n_modes=4)
+    mca_rotator.fit(mca_model)
+    return mca_rotator
+
+
 @pytest.fixture
 def mca_model_delayed(mock_dask_data_array, dim):
     mca = MCA(n_modes=5, compute=False, check_nans=False)
@@ -30,14 +50,6 @@ def test_init():
     assert mca_rotator._params["squared_loadings"] is False
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit(mca_model):
     mca_rotator = MCARotator(n_modes=4)
     mca_rotator.fit(mca_model)
@@ -46,35 +58,13 @@ def test_fit(mca_model):
     assert hasattr(mca_rotator, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_transform(mca_model, mock_data_array):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
-
+def test_transform(mca_rotator, mock_data_array):
     projections = mca_rotator.transform(data1=mock_data_array, data2=mock_data_array)
 
     assert len(projections) == 2
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_inverse_transform(mca_model):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
-
+def test_inverse_transform(mca_rotator):
     scores1 = mca_rotator.data["scores1"].sel(mode=slice(1, 3))
     scores2 = mca_rotator.data["scores2"].sel(mode=slice(1, 3))
 
@@ -84,112 +74,42 @@ def test_inverse_transform(mca_model):
     assert len(reconstructed_data) == 2
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_squared_covariance(mca_rotator):
     covariance_fraction = mca_rotator.squared_covariance()
     assert isinstance(covariance_fraction, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_squared_covariance_fraction(mca_rotator):
     squared_covariance_fraction = mca_rotator.squared_covariance_fraction()
     assert isinstance(squared_covariance_fraction, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_singular_values(mca_model):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_singular_values(mca_rotator):
     n_modes = mca_rotator.get_params()["n_modes"]
     svals = mca_rotator.singular_values()
     assert isinstance(svals, xr.DataArray)
     assert svals.size == n_modes
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_covariance_fraction(mca_model):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_covariance_fraction(mca_rotator):
     cf = mca_rotator.covariance_fraction()
     assert isinstance(cf, xr.DataArray)
     assert cf.sum("mode") <= 1.00001, "Covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_components(mca_rotator):
     comps1, comps2 = mca_rotator.components()
     assert isinstance(comps1, xr.DataArray)
     assert isinstance(comps2, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_scores(mca_rotator):
     scores1, scores2 = mca_rotator.scores()
     assert isinstance(scores1, xr.DataArray)
     assert isinstance(scores2, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_homogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_homogeneous_patterns(mca_rotator):
     patterns, pvalues = mca_rotator.homogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
@@ -197,17 +117,7 @@ def test_homogeneous_patterns(mca_model, mock_data_array, dim):
     assert isinstance(pvalues[1], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_heterogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_rotator = MCARotator(n_modes=4)
-    mca_rotator.fit(mca_model)
+def test_heterogeneous_patterns(mca_rotator):
     patterns, pvalues = mca_rotator.heterogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
@@ -215,17 +125,7 @@ def test_heterogeneous_patterns(mca_model, mock_data_array, dim):
     assert isinstance(pvalues[1], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim, compute",
-    [
-        (("time",), True),
-        (("lat", "lon"), True),
-        (("lon", "lat"), True),
-        (("time",), False),
-        (("lat", "lon"), False),
-        (("lon", "lat"), False),
-    ],
-)
+@pytest.mark.parametrize("compute", [True, False])
 def test_compute(mca_model_delayed, compute):
     """Test the compute method of the MCARotator class."""
 
@@ -253,14 +153,6 @@ def test_compute(mca_model_delayed, compute):
         assert data_is_dask(mca_rotator.data["modes_sign"])
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 @pytest.mark.parametrize("engine", ["netcdf4", "zarr"])
 def test_save_load(dim, mock_data_array, tmp_path, engine):
     """Test save/load methods in MCA class, ensuring that we can
@@ -305,14 +197,6 @@ def test_save_load(dim, mock_data_array, tmp_path, engine):
     )
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_serialize_deserialize_dataarray(dim, mock_data_array):
     """Test roundtrip serialization when the model is fit on a DataArray."""
     model = MCA()
@@ -326,14 +210,6 @@ def test_serialize_deserialize_dataarray(dim, mock_data_array):
     )
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_serialize_deserialize_dataset(dim, mock_dataset):
     """Test roundtrip serialization when the model is fit on a Dataset."""
     model = MCA()
@@ -10,8 +10,10 @@ def test_total_variance(mock_data_array):
     # Compute total variance using numpy by hand
     tot_var_ref = np.sum(np.var(arr, axis=0, ddof=1))
 
+    # Avoid in-place ops here: the stacked array can be a view of the
+    # session-scoped fixture data
     da = mock_data_array.stack(sample=("time",), feature=("lat", "lon"))
-    da -= da.mean(dim="sample")
+    da = da - da.mean(dim="sample")
     tot_var = total_variance(da, dim="sample")
     assert isinstance(tot_var, xr.DataArray)
     assert tot_var.dims == ()
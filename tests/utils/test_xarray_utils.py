@@ -0,0 +1,30 @@
+import numpy as np
+import xarray as xr
+
+from xeofs.utils.xarray_utils import get_deterministic_sign_multiplier
+from ..utilities import data_is_dask
+
+
+def test_sign_multiplier_makes_max_positive(mock_data_array):
+    """Test the get_deterministic_sign_multiplier function."""
+    da = mock_data_array.stack(feature=("lat", "lon")).rename(time="mode")
+    multiplier = get_deterministic_sign_multiplier(da, "feature")
+    flipped = da * multiplier
+
+    assert isinstance(multiplier, xr.DataArray)
+    assert multiplier.isin([-1, 1]).all()
+    # After flipping, the entry with maximum absolute value must be positive
+    max_vals = flipped.max("feature")
+    min_vals = flipped.min("feature")
+    assert (max_vals >= np.abs(min_vals)).all()
+
+
+def test_sign_multiplier_is_lazy(mock_data_array):
+    """The sign multiplier must not trigger a compute on dask input."""
+    da = (
+        mock_data_array.stack(feature=("lat", "lon"))
+        .rename(time="mode")
+        .chunk({"mode": 2})
+    )
+    multiplier = get_deterministic_sign_multiplier(da, "feature")
+    assert data_is_dask(multiplier)
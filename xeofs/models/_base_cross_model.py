@@ -50,8 +50,11 @@ class _BaseCrossModel(ABC):
     feature_name: str, default="feature"
         Name of the new feature dimension.
     solver: {"auto", "full", "randomized"}, default="auto"
-        Solver to use for the SVD computation.
-    solver_kwargs: dict, default={}
+        Solver to use for the SVD computation. With "auto", in-memory data
+        uses the full SVD for small inputs or large mode counts and the
+        randomized SVD otherwise; delayed (dask) data always uses the
+        randomized SVD.
+    solver_kwargs: dict, default=None
         Additional keyword arguments to passed to the SVD solver function.
 
     """
@@ -70,8 +73,11 @@ class _BaseCrossModel(ABC):
         feature_name="feature",
         solver="auto",
         random_state=None,
-        solver_kwargs={},
+        solver_kwargs=None,
     ):
+        # Use a fresh dict per instance to avoid mutable-default aliasing
+        solver_kwargs = {} if solver_kwargs is None else dict(solver_kwargs)
+
         self.n_modes = n_modes
         self.sample_name = sample_name
         self.feature_name = feature_name
@@ -140,6 +146,13 @@ class _BaseCrossModel(ABC):
             else None
         )
 
+    @staticmethod
+    def _fit_preprocessor(preprocessor, X, sample_dims, weights):
+        # Return the fitted preprocessor along with the transformed data so
+        # that the fit also survives schedulers which run the task in a
+        # separate process
+        return preprocessor, preprocessor.fit_transform(X, sample_dims, weights)
+
     def get_serialization_attrs(self) -> Dict:
         return dict(
             data=self.data,
@@ -181,10 +194,24 @@ class _BaseCrossModel(ABC):
             validate_input_type(weights2)
 
         self.sample_dims = convert_to_dim_type(dim)
-        # Preprocess data1
-        data1 = self.preprocessor1.fit_transform(data1, self.sample_dims, weights1)
-        # Preprocess data2
-        data2 = self.preprocessor2.fit_transform(data2, self.sample_dims, weights2)
+        # Preprocess left (1) and right (2) data. The two fits are independent
+        # and data-heavy, so for in-memory data run them as two delayed tasks
+        # computed together, letting the scheduler overlap the work. Delayed
+        # input must stay on the sequential path: passing it through
+        # ``dask.compute`` would materialize the data.
+        if data_is_dask(data1) or data_is_dask(data2):
+            data1 = self.preprocessor1.fit_transform(data1, self.sample_dims, weights1)
+            data2 = self.preprocessor2.fit_transform(data2, self.sample_dims, weights2)
+        else:
+            fit1 = dask.delayed(self._fit_preprocessor, nout=2)(
+                self.preprocessor1, data1, self.sample_dims, weights1
+            )
+            fit2 = dask.delayed(self._fit_preprocessor, nout=2)(
+                self.preprocessor2, data2, self.sample_dims, weights2
+            )
+            (self.preprocessor1, data1), (self.preprocessor2, data2) = dask.compute(
+                fit1, fit2
+            )
 
         self._fit_algorithm(data1, data2)
 
@@ -68,8 +68,11 @@ class _BaseModel(ABC):
     random_state: Optional[int], default=None
         Seed for the random number generator.
     solver: {"auto", "full", "randomized"}, default="auto"
-        Solver to use for the SVD computation.
-    solver_kwargs: dict, default={}
+        Solver to use for the SVD computation. With "auto", in-memory data
+        uses the full SVD for small inputs or large mode counts and the
+        randomized SVD otherwise; delayed (dask) data always uses the
+        randomized SVD.
+    solver_kwargs: dict, default=None
         Additional keyword arguments to pass to the SVD solver function.
 
     """
@@ -87,8 +90,11 @@ class _BaseModel(ABC):
         verbose=False,
         random_state=None,
         solver="auto",
-        solver_kwargs={},
+        solver_kwargs=None,
     ):
+        # Use a fresh dict per instance to avoid mutable-default aliasing
+        solver_kwargs = {} if solver_kwargs is None else dict(solver_kwargs)
+
         self.n_modes = n_modes
         self.sample_name = sample_name
         self.feature_name = feature_name
@@ -167,6 +173,16 @@ class _BaseModel(ABC):
             Weighting factors for the input data.
 
         """
+        self._fit(X, dim, weights)
+        return self
+
+    def _fit(
+        self,
+        X: List[Data] | Data,
+        dim: Sequence[Hashable] | Hashable,
+        weights: Optional[List[Data] | Data] = None,
+    ) -> DataArray:
+        """Fit the model and return the preprocessed 2D data."""
         # Check for invalid types
         validate_input_type(X)
         if weights is not None:
@@ -184,7 +200,7 @@ class _BaseModel(ABC):
         if self._params["compute"]:
             self.data.compute()
 
-        return self
+        return data2D
 
     @abstractmethod
     def _fit_algorithm(self, data: DataArray) -> Self:
@@ -222,6 +238,10 @@ class _BaseModel(ABC):
         validate_input_type(data)
 
         data2D = self.preprocessor.transform(data)
+        return self._transform_preprocessed(data2D, normalized=normalized)
+
+    def _transform_preprocessed(self, data2D: DataArray, normalized=True) -> DataArray:
+        """Project already preprocessed 2D data onto the components."""
         data2D = self._transform_algorithm(data2D)
         if normalized:
             data2D = data2D / self.data["norms"]
@@ -272,7 +292,10 @@ class _BaseModel(ABC):
             Projections of the data onto the components.
 
         """
-        return self.fit(data, dim, weights).transform(data, **kwargs)
+        # Reuse the 2D data produced during the fit instead of running the
+        # preprocessor a second time over the same input
+        data2D = self._fit(data, dim, weights)
+        return self._transform_preprocessed(data2D, **kwargs)
 
     def inverse_transform(
         self, scores: DataArray, normalized: bool = True
@@ -343,7 +366,9 @@ class _BaseModel(ABC):
         normalized: bool, default=True
             Whether to normalize the scores by the L2 norm.
         """
-        scores = self.data["scores"].copy()
+        # No copy needed: the normalization below produces a new object and
+        # the inverse transforms never mutate their input
+        scores = self.data["scores"]
         if normalized:
             attrs = scores.attrs.copy()
             scores = scores / self.data["norms"]
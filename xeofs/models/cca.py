@@ -176,8 +176,6 @@ class CCABaseModel(BaseEstimator):
             # NOTE: coslat weighting already happens in Preprocessor class
             pca = EOF(n_modes=n_pca_modes[i], compute=self.compute)
             pca.fit(view, dim=self.sample_name)
-            if self.compute:
-                pca.compute()
             self.pca_models.append(pca)
 
             # TODO: method to get cumulative explained variance
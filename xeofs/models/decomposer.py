@@ -4,6 +4,7 @@ import dask
 from dask.array import Array as DaskArray  # type: ignore
 from dask.diagnostics.progress import ProgressBar
 from sklearn.utils.extmath import randomized_svd
+from scipy.linalg import svd as scipy_svd  # type: ignore
 from scipy.sparse.linalg import svds as complex_svd  # type: ignore
 from dask.array.linalg import svd_compressed as dask_svd
 from typing import Optional
@@ -26,17 +27,26 @@ class Decomposer:
         Whether to flip the sign of the components to ensure deterministic output.
     compute : bool, default=True
         Whether to compute the decomposition immediately.
-    solver : {'auto', 'full', 'randomized'}, default='auto'
+    compute_uv : bool, default=True
+        Whether to compute the singular vectors. If False, only the singular
+        values are computed and stored, which allows LAPACK to skip the
+        accumulation of the singular vectors entirely for the exact solver
+        on in-memory data. The other backends compute the vectors and
+        discard them.
+    solver : {'auto', 'full', 'randomized', 'arpack'}, default='auto'
         The solver is selected by a default policy based on size of `X` and `n_modes`:
         if the input data is larger than 500x500 and the number of modes to extract is lower
         than 80% of the smallest dimension of the data, then the more efficient
         `randomized` method is enabled. Otherwise the exact full SVD is computed
-        and optionally truncated afterwards.
+        and optionally truncated afterwards. Delayed (dask) data always uses the
+        `randomized` method. With `arpack`, the truncated SVD is computed by
+        scipy's iterative ARPACK solver, which only touches the data through
+        matrix-vector products; this is not supported for delayed data.
     random_state : Optional[int], default=None
         Seed for the random number generator.
     verbose: bool, default=False
         Whether to show a progress bar when computing the decomposition.
-    solver_kwargs : dict, default={}
+    solver_kwargs : dict, default=None
         Additional keyword arguments passed to the SVD solver.
     """
 
@@ -45,18 +55,21 @@ class Decomposer:
         n_modes: int,
         flip_signs: bool = True,
         compute: bool = True,
+        compute_uv: bool = True,
         solver: str = "auto",
         random_state: Optional[int] = None,
         verbose: bool = False,
-        solver_kwargs: dict = {},
+        solver_kwargs: Optional[dict] = None,
     ):
         self.n_modes = n_modes
         self.flip_signs = flip_signs
         self.compute = compute
+        self.compute_uv = compute_uv
         self.verbose = verbose
         self.solver = solver
         self.random_state = random_state
-        self.solver_kwargs = solver_kwargs
+        # Use a fresh dict per instance to avoid mutable-default aliasing
+        self.solver_kwargs = {} if solver_kwargs is None else dict(solver_kwargs)
 
     def fit(self, X, dims=("sample", "feature")):
         """Decomposes the data object.
@@ -91,26 +104,76 @@ class Decomposer:
 
         match self.solver:
             case "auto":
+                # Exact SVD on dask data requires chunking in one dimension
+                # only, so delayed data always goes through the randomized path
                 use_exact = (
-                    True if is_small_data and self.n_modes > int(0.8 * rank) else False
+                    True
+                    if not use_dask
+                    and (is_small_data or self.n_modes > int(0.8 * rank))
+                    else False
                 )
             case "full":
                 use_exact = True
-            case "randomized":
+            case "randomized" | "arpack":
                 use_exact = False
             case _:
                 raise ValueError(
                     f"Unrecognized solver '{self.solver}'. "
-                    "Valid options are 'auto', 'full', and 'randomized'."
+                    "Valid options are 'auto', 'full', 'randomized', and 'arpack'."
                 )
 
-        # Use exact SVD for small data sets
+        use_arpack = self.solver == "arpack"
+        if use_arpack and use_dask:
+            raise ValueError(
+                "solver='arpack' is not supported for delayed data. "
+                "Please use solver='randomized' instead."
+            )
+
+        # Skip the computation of the singular vectors entirely when only
+        # the singular values are requested. Only the exact solver on
+        # in-memory data supports this, but it is also where the saving is
+        # largest since LAPACK can skip accumulating U and V. All other
+        # backends (including dask, whose svd has no compute_uv argument)
+        # compute the vectors and simply discard them below.
+        if use_exact and not use_dask and not self.compute_uv:
+            s = self._svd_values(X, dims, self.solver_kwargs)
+            s = s[: self.n_modes]
+            s = s.assign_coords(mode=range(1, s.mode.size + 1))
+            s.name = "s"
+            self.s_ = s
+            return
+
+        # Use exact SVD for small data sets. In-memory data goes through
+        # scipy, which can skip the finite check already handled by the
+        # sanitizer; dask data must use numpy's svd for dask dispatch.
         if use_exact:
-            U, s, VT = self._svd(X, dims, np.linalg.svd, self.solver_kwargs)
+            # Default to the economy SVD; the full singular matrices would
+            # be truncated to n_modes right away anyway
+            if use_dask:
+                solver_kwargs = {"full_matrices": False} | self.solver_kwargs
+                U, s, VT = self._svd(X, dims, np.linalg.svd, solver_kwargs)
+            else:
+                solver_kwargs = {
+                    "full_matrices": False,
+                    "check_finite": False,
+                } | self.solver_kwargs
+                U, s, VT = self._svd(X, dims, scipy_svd, solver_kwargs)
             U = U[:, : self.n_modes]
             s = s[: self.n_modes]
             VT = VT[: self.n_modes, :]
 
+        # Use scipy's iterative ARPACK solver when explicitly requested
+        elif use_arpack:
+            solver_kwargs = self.solver_kwargs | {
+                "k": self.n_modes,
+                "random_state": self.random_state,
+            }
+            U, s, VT = self._svd(X, dims, complex_svd, solver_kwargs)
+            idx_sort = np.argsort(s)[::-1]
+            U = U[:, idx_sort]
+            s = s[idx_sort]
+            VT = VT[idx_sort, :]
+
         # Use randomized SVD for large, real-valued data sets
         elif (not use_complex) and (not use_dask):
             solver_kwargs = self.solver_kwargs | {
@@ -141,6 +204,10 @@ class Decomposer:
             }
             solver_kwargs.setdefault("compute", self.compute)
             solver_kwargs.setdefault("n_power_iter", 4)
+            # The deterministic sign flipping below supersedes dask's own
+            # sign coercion, so skip that extra pass over the results
+            if self.flip_signs:
+                solver_kwargs.setdefault("coerce_signs", False)
             U, s, VT = self._svd(X, dims, dask_svd, solver_kwargs)
             U, s, VT = self._compute_svd_result(U, s, VT)
         else:
@@ -150,12 +217,19 @@ class Decomposer:
             )
             raise NotImplementedError(err_msg)
 
+        s = s.assign_coords(mode=range(1, s.mode.size + 1))
+        s.name = "s"
+
+        # The remaining solvers always produce singular vectors; discard
+        # them if they were not requested
+        if not self.compute_uv:
+            self.s_ = s
+            return
+
         U = U.assign_coords(mode=range(1, U.mode.size + 1))
-        s = s.assign_coords(mode=range(1, U.mode.size + 1))
         VT = VT.assign_coords(mode=range(1, U.mode.size + 1))
 
         U.name = "U"
-        s.name = "s"
         VT.name = "V"
 
         if self.flip_signs:
@@ -211,6 +285,32 @@ class Decomposer:
                 "2. If the error persists, please raise an issue at https://github.com/xarray-contrib/xeofs/issues."
             )
 
+    def _svd_values(self, X, dims, kwargs):
+        """Computes only the singular values of in-memory data.
+
+        Parameters
+        ----------
+        X : DataArray
+            A 2-dimensional data object to be decomposed.
+        dims : tuple of str
+            Dimensions of the data object.
+        kwargs : dict
+            Additional keyword arguments passed to the SVD solver.
+
+        Returns
+        -------
+        s : DataArray
+            Singular values.
+        """
+        kwargs = {"check_finite": False} | kwargs | {"compute_uv": False}
+        return xr.apply_ufunc(
+            scipy_svd,
+            X,
+            kwargs=kwargs,
+            input_core_dims=[dims],
+            output_core_dims=[["mode"]],
+        )
+
     def _compute_svd_result(self, U, s, VT):
         """Computes the SVD result.
 
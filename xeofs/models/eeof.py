@@ -74,7 +74,7 @@ class ExtendedEOF(EOF):
         compute: bool = True,
         solver: str = "auto",
         random_state: Optional[int] = None,
-        solver_kwargs: dict = {},
+        solver_kwargs: Optional[dict] = None,
         **kwargs,
     ):
         super().__init__(
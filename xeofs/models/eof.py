@@ -42,7 +42,7 @@ class EOF(_BaseModel):
         Seed for the random number generator.
     solver: {"auto", "full", "randomized"}, default="auto"
         Solver to use for the SVD computation.
-    solver_kwargs: dict, default={}
+    solver_kwargs: dict, default=None
         Additional keyword arguments to be passed to the SVD solver.
 
     Examples
@@ -66,7 +66,7 @@ class EOF(_BaseModel):
         verbose: bool = False,
         random_state: Optional[int] = None,
         solver: str = "auto",
-        solver_kwargs: Dict = {},
+        solver_kwargs: Optional[Dict] = None,
         **kwargs,
     ):
         super().__init__(
@@ -285,7 +285,7 @@ class ComplexEOF(EOF):
         Seed for the random number generator.
     solver: {"auto", "full", "randomized"}, default="auto"
         Solver to use for the SVD computation.
-    solver_kwargs: dict, default={}
+    solver_kwargs: dict, default=None
         Additional keyword arguments to be passed to the SVD solver.
     solver_kwargs : dict, optional
         Additional keyword arguments to be passed to the SVD solver.
@@ -319,7 +319,7 @@ class ComplexEOF(EOF):
         verbose: bool = False,
         random_state: Optional[int] = None,
         solver: str = "auto",
-        solver_kwargs: Dict = {},
+        solver_kwargs: Optional[Dict] = None,
         **kwargs,
     ):
         super().__init__(
@@ -457,7 +457,7 @@ class ComplexEOF(EOF):
             Amplitude of the scores of the fitted model.
 
         """
-        scores = self.data["scores"].copy()
+        scores = self.data["scores"]
         if normalized:
             scores = scores / self.data["norms"]
 
@@ -51,7 +51,7 @@ class MCA(_BaseCrossModel):
         Solver to use for the SVD computation.
     random_state: int, default=None
         Seed for the random number generator.
-    solver_kwargs: dict, default={}
+    solver_kwargs: dict, default=None
         Additional keyword arguments passed to the SVD solver function.
 
     Notes
@@ -85,7 +85,7 @@ class MCA(_BaseCrossModel):
         feature_name: str = "feature",
         solver: str = "auto",
         random_state: Optional[int] = None,
-        solver_kwargs: Dict = {},
+        solver_kwargs: Optional[Dict] = None,
         **kwargs,
     ):
         super().__init__(
@@ -607,7 +607,7 @@ class ComplexMCA(MCA):
         Solver to use for the SVD computation.
     random_state: int, optional
         Random state for randomized SVD solver.
-    solver_kwargs: dict, default={}
+    solver_kwargs: dict, default=None
         Additional keyword arguments passed to the SVD solver.
 
     Notes
@@ -648,7 +648,7 @@ class ComplexMCA(MCA):
         feature_name: str = "feature",
         solver: str = "auto",
         random_state: Optional[bool] = None,
-        solver_kwargs: Dict = {},
+        solver_kwargs: Optional[Dict] = None,
         **kwargs,
     ):
         super().__init__(
@@ -829,10 +829,14 @@ class ComplexMCA(MCA):
             Phase of the right components.
 
         """
-        comps1 = xr.apply_ufunc(np.angle, self.data["components1"], keep_attrs=True)
+        comps1 = xr.apply_ufunc(
+            np.angle, self.data["components1"], dask="allowed", keep_attrs=True
+        )
         comps1.name = "left_components_phase"
 
-        comps2 = xr.apply_ufunc(np.angle, self.data["components2"], keep_attrs=True)
+        comps2 = xr.apply_ufunc(
+            np.angle, self.data["components2"], dask="allowed", keep_attrs=True
+        )
         comps2.name = "right_components_phase"
 
         comps1 = self.preprocessor1.inverse_transform_components(comps1)
@@ -888,8 +892,12 @@ class ComplexMCA(MCA):
             Phase of the right scores.
 
         """
-        scores1 = xr.apply_ufunc(np.angle, self.data["scores1"], keep_attrs=True)
-        scores2 = xr.apply_ufunc(np.angle, self.data["scores2"], keep_attrs=True)
+        scores1 = xr.apply_ufunc(
+            np.angle, self.data["scores1"], dask="allowed", keep_attrs=True
+        )
+        scores2 = xr.apply_ufunc(
+            np.angle, self.data["scores2"], dask="allowed", keep_attrs=True
+        )
 
         scores1.name = "left_scores_phase"
         scores2.name = "right_scores_phase"
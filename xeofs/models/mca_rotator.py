@@ -1,4 +1,5 @@
 from datetime import datetime
+import dask
 import numpy as np
 import xarray as xr
 from typing import List, Dict
@@ -8,7 +9,11 @@ from .mca import MCA, ComplexMCA
 from ..preprocessing.preprocessor import Preprocessor
 from ..utils.rotation import promax
 from ..utils.data_types import DataArray, DataObject
-from ..utils.xarray_utils import argsort_dask, get_deterministic_sign_multiplier
+from ..utils.xarray_utils import (
+    argsort_dask,
+    data_is_dask,
+    get_deterministic_sign_multiplier,
+)
 from ..data_container import DataContainer
 from .._version import __version__
 
@@ -216,31 +221,24 @@ class MCARotator(MCA):
             {self.feature_name: slice(comps1.coords[self.feature_name].size, None)}
         )
 
-        # Normalization factor of singular vectors
-        norm1_rot = xr.apply_ufunc(
-            np.linalg.norm,
-            comps1_rot,
-            input_core_dims=[[self.feature_name, "mode"]],
-            output_core_dims=[["mode"]],
-            exclude_dims={self.feature_name},
-            kwargs={"axis": 0},
-            vectorize=False,
-            dask="allowed",
+        # Normalization factor of singular vectors. Use a plain xarray
+        # reduction instead of np.linalg.norm so the norm is a single fused
+        # (and, for dask input, lazy) pass over the loadings; the conjugate
+        # product also covers complex loadings.
+        norm1_rot = np.sqrt(
+            (comps1_rot * comps1_rot.conj()).real.sum(self.feature_name)
         )
-        norm2_rot = xr.apply_ufunc(
-            np.linalg.norm,
-            comps2_rot,
-            input_core_dims=[[self.feature_name, "mode"]],
-            output_core_dims=[["mode"]],
-            exclude_dims={self.feature_name},
-            kwargs={"axis": 0},
-            vectorize=False,
-            dask="allowed",
+        norm2_rot = np.sqrt(
+            (comps2_rot * comps2_rot.conj()).real.sum(self.feature_name)
         )
 
-        # Rotated (normalized) singular vectors
-        comps1_rot = comps1_rot / norm1_rot
-        comps2_rot = comps2_rot / norm2_rot
+        # Ensure consistent signs for deterministic output
+        modes_sign = get_deterministic_sign_multiplier(rot_loadings, self.feature_name)
+
+        # Rotated (normalized) singular vectors. Fold the sign flip into the
+        # normalization factor so each block is scaled in a single pass
+        comps1_rot = comps1_rot * (modes_sign / norm1_rot)
+        comps2_rot = comps2_rot * (modes_sign / norm2_rot)
 
         # Remove the squaring introduced by the squared loadings approach
         if use_squared_loadings:
@@ -265,16 +263,12 @@ class MCARotator(MCA):
         scores1 = scores1.rename({"mode": "mode_m"})
         scores2 = scores2.rename({"mode": "mode_m"})
         RinvT = RinvT.rename({"mode_n": "mode"})
+        # Fold the sign flip into the small rotation matrix so the
+        # sample-sized score matrices are not multiplied a second time
+        RinvT = RinvT * modes_sign
         scores1_rot = xr.dot(scores1, RinvT, dims="mode_m")
         scores2_rot = xr.dot(scores2, RinvT, dims="mode_m")
 
-        # Ensure consitent signs for deterministic output
-        modes_sign = get_deterministic_sign_multiplier(rot_loadings, self.feature_name)
-        comps1_rot = comps1_rot * modes_sign
-        comps2_rot = comps2_rot * modes_sign
-        scores1_rot = scores1_rot * modes_sign
-        scores2_rot = scores2_rot * modes_sign
-
         # Create data container
         self.data.add(
             name="input_data1", data=self.model.data["input_data1"], allow_compute=False
@@ -348,67 +342,71 @@ class MCARotator(MCA):
         )
         RinvT = RinvT.rename({"mode_n": "mode"})
 
-        results = []
+        projections = []
 
         if data1 is not None:
             # Select the (non-rotated) singular vectors of the first dataset
             comps1 = self.model.data["components1"].sel(mode=slice(1, n_modes))
             norm1 = self.model.data["norm1"].sel(mode=slice(1, n_modes))
-
-            # Preprocess the data
-            data1 = self.preprocessor1.transform(data1)
-
-            # Compute non-rotated scores by projecting the data onto non-rotated components
-            projections1 = xr.dot(data1, comps1) / norm1
-            # Rotate the scores
-            projections1 = projections1.rename({"mode": "mode_m"})
-            projections1 = xr.dot(projections1, RinvT, dims="mode_m")
-            # Reorder according to variance
-            if self.sorted:
-                projections1 = projections1.isel(
-                    mode=self.data["idx_modes_sorted"].values
-                ).assign_coords(mode=projections1.mode)
-            # Adapt the sign of the scores
-            projections1 = projections1 * self.data["modes_sign"]
-
-            # Unstack the projections
-            projections1 = self.preprocessor1.inverse_transform_scores(projections1)
-
-            results.append(projections1)
+            projections.append((data1, self.preprocessor1, comps1, norm1))
 
         if data2 is not None:
             # Select the (non-rotated) singular vectors of the second dataset
             comps2 = self.model.data["components2"].sel(mode=slice(1, n_modes))
             norm2 = self.model.data["norm2"].sel(mode=slice(1, n_modes))
+            projections.append((data2, self.preprocessor2, comps2, norm2))
+
+        if len(projections) == 1 or any(
+            data_is_dask(data) for data, _, _, _ in projections
+        ):
+            # Dask-backed data already builds a lazy graph, so there is
+            # nothing to parallelize here
+            results = [self._transform_single(*args, RinvT) for args in projections]
+        else:
+            # The two projections are independent of each other, so submit
+            # them to the dask scheduler together to run them in parallel
+            results = list(
+                dask.compute(
+                    *[
+                        dask.delayed(self._transform_single)(*args, RinvT)
+                        for args in projections
+                    ]
+                )
+            )
 
-            # Preprocess the data
-            data2 = self.preprocessor2.transform(data2)
-
-            # Compute non-rotated scores by project the data onto non-rotated components
-            projections2 = xr.dot(data2, comps2) / norm2
-            # Rotate the scores
-            projections2 = projections2.rename({"mode": "mode_m"})
-            projections2 = xr.dot(projections2, RinvT, dims="mode_m")
-            # Reorder according to variance
-            if self.sorted:
-                projections2 = projections2.isel(
-                    mode=self.data["idx_modes_sorted"].values
-                ).assign_coords(mode=projections2.mode)
-            # Determine the sign of the scores
-            projections2 = projections2 * self.data["modes_sign"]
-
-            # Unstack the projections
-            projections2 = self.preprocessor2.inverse_transform_scores(projections2)
-
-            results.append(projections2)
-
-        if len(results) == 0:
-            raise ValueError("provide at least one of [`data1`, `data2`]")
-        elif len(results) == 1:
+        if len(results) == 1:
             return results[0]
         else:
             return results
 
+    def _transform_single(
+        self,
+        data: DataObject,
+        preprocessor: Preprocessor,
+        comps: DataArray,
+        norm: DataArray,
+        RinvT: DataArray,
+    ) -> DataArray:
+        """Project a single dataset onto the rotated singular vectors."""
+        # Preprocess the data
+        data = preprocessor.transform(data)
+
+        # Compute non-rotated scores by projecting the data onto non-rotated components
+        projections = xr.dot(data, comps) / norm
+        # Rotate the scores
+        projections = projections.rename({"mode": "mode_m"})
+        projections = xr.dot(projections, RinvT, dims="mode_m")
+        # Reorder according to variance
+        if self.sorted:
+            projections = projections.isel(
+                mode=self.data["idx_modes_sorted"].values
+            ).assign_coords(mode=projections.mode)
+        # Adapt the sign of the scores
+        projections = projections * self.data["modes_sign"]
+
+        # Unstack the projections
+        return preprocessor.inverse_transform_scores(projections)
+
 
 class ComplexMCARotator(MCARotator, ComplexMCA):
     """Rotate a solution obtained from ``xe.models.ComplexMCA``.
@@ -43,7 +43,7 @@ class OPA(_BaseModel):
         Name of the feature dimension.
     solver : {"auto", "full", "randomized"}, default="auto"
         Solver to use for the SVD computation.
-    solver_kwargs : dict, default={}
+    solver_kwargs : dict, default=None
         Additional keyword arguments to pass to the solver.
 
     References
@@ -81,7 +81,7 @@ class OPA(_BaseModel):
         feature_name: str = "feature",
         solver: str = "auto",
         random_state: Optional[int] = None,
-        solver_kwargs: Dict = {},
+        solver_kwargs: Optional[Dict] = None,
     ):
         if n_modes > n_pca_modes:
             raise ValueError(
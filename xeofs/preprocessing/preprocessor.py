@@ -285,7 +285,8 @@ class Preprocessor(Transformer):
             The inverse transformed data.
 
         """
-        X_it = X.copy()
+        # No copy needed: none of the transformers mutate their input
+        X_it = X
         for transformer in self.get_transformers(inverse=True):
             X_it = transformer.inverse_transform_data(X_it)
 
@@ -305,7 +306,8 @@ class Preprocessor(Transformer):
             The inverse transformed components.
 
         """
-        X_it = X.copy()
+        # No copy needed: none of the transformers mutate their input
+        X_it = X
         for transformer in self.get_transformers(inverse=True):
             X_it = transformer.inverse_transform_components(X_it)
 
@@ -327,7 +329,8 @@ class Preprocessor(Transformer):
             The inverse transformed scores.
 
         """
-        X_it = X.copy()
+        # No copy needed: none of the transformers mutate their input
+        X_it = X
         for transformer in self.get_transformers(inverse=True):
             X_it = transformer.inverse_transform_scores(X_it)
 
@@ -349,7 +352,8 @@ class Preprocessor(Transformer):
             The inverse transformed scores.
 
         """
-        X_it = X.copy()
+        # No copy needed: none of the transformers mutate their input
+        X_it = X
         for transformer in self.get_transformers(inverse=True):
             X_it = transformer.inverse_transform_scores_unseen(X_it)
 
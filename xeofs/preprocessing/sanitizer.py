@@ -48,17 +48,17 @@ class Sanitizer(Transformer):
                 "Cannot transform data. Feature coordinates are different."
             )
 
-    def _get_valid_features(self, X: Data) -> Data:
-        return X.notnull().any(self.sample_name)
+    def _get_valid_features(self, X_is_notnull: Data) -> Data:
+        return X_is_notnull.any(self.sample_name)
 
-    def _get_valid_samples(self, X: Data) -> Data:
-        return X.notnull().any(self.feature_name)
+    def _get_valid_samples(self, X_is_notnull: Data) -> Data:
+        return X_is_notnull.any(self.feature_name)
 
-    def _get_valid_features_per_sample(self, X: Data) -> Data:
+    def _get_valid_features_per_sample(self, X_is_notnull: Data) -> Data:
         """Isolated NaN check that an be constructed lazily, where we check that
         the number of valid features is the same for every sample, with
         the exception of all-NaN samples."""
-        return X.notnull().sum(self.feature_name)
+        return X_is_notnull.sum(self.feature_name)
 
     def fit(
         self,
@@ -76,9 +76,11 @@ class Sanitizer(Transformer):
         self.feature_coords = X.coords[self.feature_name]
         self.sample_coords = X.coords[self.sample_name]
 
-        # Identify NaN locations
-        self.is_valid_feature = self._get_valid_features(X)
-        self.is_valid_sample = self._get_valid_samples(X)
+        # Identify NaN locations; evaluate the NaN mask only once and
+        # derive both reductions from it
+        is_not_null = X.notnull()
+        self.is_valid_feature = self._get_valid_features(is_not_null)
+        self.is_valid_sample = self._get_valid_samples(is_not_null)
 
         return self
 
@@ -92,12 +94,16 @@ class Sanitizer(Transformer):
         # Check if input has the correct coordinates
         self._check_input_coords(X)
 
-        X_valid_features = self._get_valid_features(X)
-        X_valid_samples = self._get_valid_samples(X)
-        X_valid_features_per_sample = self._get_valid_features_per_sample(X)
-
         # Optionally skip NaN checks to preserve lazy computation for dask arrays
         if self.check_nans:
+            # Evaluate the NaN mask only once for all three reductions
+            is_not_null = X.notnull()
+            X_valid_features = self._get_valid_features(is_not_null)
+            X_valid_samples = self._get_valid_samples(is_not_null)
+            X_valid_features_per_sample = self._get_valid_features_per_sample(
+                is_not_null
+            )
+
             (
                 self.is_valid_feature,
                 X_valid_features,
@@ -7,7 +7,7 @@ import xarray as xr
 
 from .transformer import Transformer
 from ..utils.data_types import Dims, DataArray, DataVar, DataVarBound
-from ..utils.xarray_utils import compute_sqrt_cos_lat_weights, feature_ones_like
+from ..utils.xarray_utils import compute_sqrt_cos_lat_weights
 
 
 class Scaler(Transformer):
@@ -46,7 +46,7 @@ class Scaler(Transformer):
         self.mean_ = xr.DataArray(name="mean_")
         self.std_ = xr.DataArray(name="std_")
         self.coslat_weights_ = xr.DataArray(name="coslat_weights_")
-        self.weights_ = xr.DataArray(name="weights_")
+        self.weights_: Optional[DataVar] = None
 
     def get_serialization_attrs(self) -> Dict:
         return dict(
@@ -60,14 +60,6 @@ class Scaler(Transformer):
         if not isinstance(X, (xr.DataArray, xr.Dataset)):
             raise TypeError(f"{name} must be an xarray DataArray or Dataset")
 
-    def _process_weights(self, X: DataVarBound, weights) -> DataVarBound:
-        if weights is None:
-            wghts: DataVarBound = feature_ones_like(X, self.feature_dims)
-        else:
-            wghts: DataVarBound = weights
-
-        return wghts
-
     def fit(
         self,
         X: DataVar,
@@ -114,8 +106,9 @@ class Scaler(Transformer):
                 data=X, feature_dims=self.feature_dims
             )
 
-        # Convert None weights to ones
-        self.weights_: DataVar = self._process_weights(X, weights)
+        # Keep None weights as None so the transform can skip the
+        # multiplication entirely when no factors apply
+        self.weights_ = weights
 
         if self.get_params()["compute"]:
             (self.mean_, self.std_, self.coslat_weights_, self.weights_) = dask.compute(
@@ -147,12 +140,20 @@ class Scaler(Transformer):
 
         if params["with_center"]:
             X = X - self.mean_
+
+        # Combine the multiplicative factors first; they are feature-sized,
+        # so this needs only a single pass over the full data. Without any
+        # factor the multiplication is skipped entirely.
+        scale = self.weights_
         if params["with_std"]:
-            X = X / self.std_
+            scale = 1.0 / self.std_ if scale is None else scale / self.std_
         if params["with_coslat"]:
-            X = X * self.coslat_weights_
+            scale = (
+                self.coslat_weights_ if scale is None else scale * self.coslat_weights_
+            )
 
-        X = X * self.weights_
+        if scale is not None:
+            X = X * scale
         return X
 
     def fit_transform(
@@ -181,11 +182,20 @@ class Scaler(Transformer):
         self._verify_input(X, "X")
 
         params = self.get_params()
-        X = X / self.weights_
+
+        # Combine the multiplicative factors first; they are feature-sized,
+        # so this needs only a single pass over the full data. Without any
+        # factor the division is skipped entirely.
+        scale = self.weights_
         if params["with_coslat"]:
-            X = X / self.coslat_weights_
+            scale = (
+                self.coslat_weights_ if scale is None else scale * self.coslat_weights_
+            )
         if params["with_std"]:
-            X = X * self.std_
+            scale = 1.0 / self.std_ if scale is None else scale / self.std_
+
+        if scale is not None:
+            X = X / scale
         if params["with_center"]:
             X = X + self.mean_
 
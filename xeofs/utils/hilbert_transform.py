@@ -1,6 +1,6 @@
 import numpy as np
 import xarray as xr
-from scipy.signal import hilbert  # type: ignore
+from scipy.fft import rfft, ifft  # type: ignore
 from .data_types import DataArray
 
 
@@ -60,7 +60,7 @@ def _hilbert_transform_with_padding(y, padding: str = "exp", decay_factor: float
     if padding == "exp":
         y = _pad_exp(y, decay_factor=decay_factor)
 
-    y = hilbert(y, axis=0)
+    y = _hilbert(y)
 
     if padding == "exp":
         y = y[n_samples : 2 * n_samples]
@@ -72,6 +72,40 @@ def _hilbert_transform_with_padding(y, padding: str = "exp", decay_factor: float
     return y
 
 
+def _hilbert(y):
+    """Construct the analytic signal along the first axis.
+
+    Equivalent to ``scipy.signal.hilbert(y, axis=0)`` but computes the
+    forward transform with ``rfft``, which only evaluates the non-negative
+    frequencies and is therefore about twice as fast for real input.
+
+    Parameters:
+    ------------
+    y: np.ndarray
+        Real input array.
+
+    Returns:
+    ---------
+    y: np.ndarray
+        Analytic signal of the input array.
+
+    """
+    n_samples = y.shape[0]
+
+    spectrum = rfft(y, axis=0)
+    # Double the positive frequencies, leaving DC (and Nyquist for even
+    # lengths) untouched; the negative frequencies remain zero
+    if n_samples % 2 == 0:
+        spectrum[1:-1] *= 2
+    else:
+        spectrum[1:] *= 2
+
+    full_spectrum = np.zeros((n_samples,) + y.shape[1:], dtype=spectrum.dtype)
+    full_spectrum[: spectrum.shape[0]] = spectrum
+
+    return ifft(full_spectrum, axis=0)
+
+
 def _pad_exp(y, decay_factor: float = 0.2):
     """Pad the input array with an exponential decay function.
 
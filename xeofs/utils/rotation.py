@@ -167,8 +167,9 @@ def _varimax(
         err_msg = err_msg.format(n_modes)
         raise ValueError(err_msg)
 
-    # Initialize rotation matrix
-    R = np.eye(n_modes)
+    # Initialize rotation matrix, matching the dtype of the loadings so
+    # that single-precision input is not upcast by the rotation
+    R = np.eye(n_modes, dtype=X.dtype)
 
     # Normalize the matrix using square root of the sum of squares (Kaiser)
     h = np.sqrt(np.sum(X * X.conj(), axis=1))
@@ -80,8 +80,11 @@ def feature_ones_like(data: DataVar, feature_dims: Dims) -> DataVar:
         valid_dims = set(data.dims) & set(feature_dims)
         feature_coords = {dim: data[dim] for dim in valid_dims}
         shape = tuple(coords.size for coords in feature_coords.values())
+        # Match the dtype of the data so that e.g. single-precision input
+        # is not silently upcast to double precision by the weighting
+        dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else float
         return xr.DataArray(
-            np.ones(shape, dtype=float),
+            np.ones(shape, dtype=dtype),
             dims=tuple(valid_dims),
             coords=feature_coords,
         )
@@ -124,6 +127,10 @@ def compute_sqrt_cos_lat_weights(data: DataVar, feature_dims: Dims) -> DataVar:
         weights = sqrt_cos_lat_weights(latitudes)
         # Features that cannot be associated to a latitude receive a weight of 1
         # weights = weights.where(weights.notnull(), 1)
+        # Latitude coordinates are float64; match the data dtype so that
+        # single-precision input is not upcast by the weighting
+        if np.issubdtype(data.dtype, np.floating):
+            weights = weights.astype(data.dtype)
         weights.name = "coslat_weights"
         return weights
     elif isinstance(data, xr.Dataset):
@@ -295,10 +302,13 @@ def get_deterministic_sign_multiplier(data: DataArray, dim: str) -> DataArray:
     min_max = xr.concat([data.max(dim), data.min(dim)], dim="sign")
     min_max = min_max.assign_coords(sign=[1, -1])
     sign_multiplier = np.abs(min_max).idxmax("sign")
-    # Drop all dimensions except 'mode' so that the index is clean
-    for dim, coords in sign_multiplier.coords.items():
-        if dim != "mode":
-            sign_multiplier = sign_multiplier.drop(dim)
+    # idxmax promotes the +1/-1 values to float64; cast back to the real
+    # dtype of the data so the flip does not upcast single-precision results
+    sign_multiplier = sign_multiplier.astype(data.real.dtype)
+    # Drop all coordinates except 'mode' in one go so that the index is clean
+    extra_coords = [name for name in sign_multiplier.coords if name != "mode"]
+    if extra_coords:
+        sign_multiplier = sign_multiplier.drop_vars(extra_coords)
     return sign_multiplier
 
 